@@ -41,6 +41,13 @@ class Af1(AnophelesDataResource):
         If True, show a progress bar during longer-running computations.
     check_location : bool, optional
         If True, use ipinfo to check the location of the client system.
+    zarr_cache_size : int, optional
+        If provided, cache up to this many bytes of zarr chunk data in memory
+        for each zarr hierarchy opened, to avoid repeatedly fetching the same
+        data from remote storage. Ignored if data are on the local file system.
+    threads : int, optional
+        Maximum number of threads to use when opening data for multiple sample
+        sets concurrently.
     **kwargs
         Passed through to fsspec when setting up file system access.
 
@@ -87,6 +94,8 @@ class Af1(AnophelesDataResource):
         discordant_read_calls_analysis=None,
         pre=False,
         tqdm_class=None,
+        zarr_cache_size=None,
+        threads=8,
         **storage_options,  # used by fsspec via init_filesystem()
     ):
         super().__init__(
@@ -120,6 +129,8 @@ class Af1(AnophelesDataResource):
             taxon_colors=TAXON_COLORS,
             virtual_contigs=None,
             gene_names=None,
+            zarr_cache_size=zarr_cache_size,
+            threads=threads,
         )
 
     def __repr__(self):
@@ -1,4 +1,5 @@
 import sys
+from typing import Optional, Tuple
 
 import dask
 import pandas as pd
@@ -99,6 +100,13 @@ class Ag3(AnophelesDataResource):
         If True, show a progress bar during longer-running computations.
     check_location : bool, optional
         If True, use ipinfo to check the location of the client system.
+    zarr_cache_size : int, optional
+        If provided, cache up to this many bytes of zarr chunk data in memory
+        for each zarr hierarchy opened, to avoid repeatedly fetching the same
+        data from remote storage. Ignored if data are on the local file system.
+    threads : int, optional
+        Maximum number of threads to use when opening data for multiple sample
+        sets concurrently.
     **kwargs
         Passed through to fsspec when setting up file system access.
 
@@ -146,6 +154,8 @@ class Ag3(AnophelesDataResource):
         discordant_read_calls_analysis=None,
         pre=False,
         tqdm_class=None,
+        zarr_cache_size=None,
+        threads=8,
         **storage_options,  # used by fsspec via init_filesystem()
     ):
         super().__init__(
@@ -186,20 +196,25 @@ class Ag3(AnophelesDataResource):
             taxon_colors=TAXON_COLORS,
             virtual_contigs=VIRTUAL_CONTIGS,
             gene_names=GENE_NAMES,
+            zarr_cache_size=zarr_cache_size,
+            threads=threads,
         )
 
         # set up caches
         self._cache_cross_metadata = None
+        self._cache_v3_wild: Optional[Tuple[str, ...]] = None
 
     @property
     def v3_wild(self):
         """Legacy, convenience property to access sample sets from the
         3.0 release, excluding the lab crosses."""
-        return [
-            x
-            for x in self.sample_sets(release="3.0")["sample_set"].tolist()
-            if x != "AG1000G-X"
-        ]
+        if self._cache_v3_wild is None:
+            self._cache_v3_wild = tuple(
+                x
+                for x in self.sample_sets(release="3.0")["sample_set"].tolist()
+                if x != "AG1000G-X"
+            )
+        return list(self._cache_v3_wild)
 
     def __repr__(self):
         text = (
@@ -316,7 +331,15 @@ class Ag3(AnophelesDataResource):
                     sep="\t",
                     na_values=["", "0"],
                     names=fam_names,
-                    dtype={"sex": str},
+                    # N.B., 'phenotype' column is not used, so don't parse it.
+                    usecols=fam_names[:-1],
+                    dtype={
+                        "cross": "object",
+                        "sample_id": "object",
+                        "father_id": "object",
+                        "mother_id": "object",
+                        "sex": str,
+                    },
                 )
 
             debug("convert 'sex' column for consistency with sample metadata")
@@ -327,9 +350,6 @@ class Ag3(AnophelesDataResource):
             df["role"] = "progeny"
             df.loc[df["mother_id"].isna(), "role"] = "parent"
 
-            debug("drop 'phenotype' column, not used")
-            df.drop("phenotype", axis="columns", inplace=True)
-
             self._cache_cross_metadata = df
 
         return self._cache_cross_metadata.copy()
@@ -19,6 +19,7 @@ import bokeh.io
 import numpy as np
 import pandas as pd
 import zarr  # type: ignore
+from fsspec.implementations.local import LocalFileSystem  # type: ignore
 from numpydoc_decorator import doc  # type: ignore
 from tqdm.auto import tqdm as tqdm_auto
 from tqdm.dask import TqdmCallback
@@ -31,6 +32,7 @@ from ..util import (
     check_types,
     hash_params,
     init_filesystem,
+    init_zarr_store,
 )
 from . import base_params
 
@@ -53,6 +55,8 @@ class AnophelesBase:
         storage_options: Optional[Mapping] = None,
         results_cache: Optional[str] = None,
         tqdm_class=None,
+        zarr_cache_size: Optional[int] = None,
+        threads: int = 1,
     ):
         self._url = url
         self._config_path = config_path
@@ -83,6 +87,17 @@ class AnophelesBase:
                 "An error occurred establishing a connection to the storage system. Please see the nested exception for more details."
             ) from exc
 
+        # Set up in-memory caching of zarr chunks. N.B., this is only useful
+        # when data are read from remote storage, for a local file system
+        # the overhead of caching outweighs any benefit, so don't cache.
+        if isinstance(self._fs, LocalFileSystem):
+            zarr_cache_size = None
+        self._zarr_cache_size = zarr_cache_size
+
+        # Maximum number of threads to use when opening data for multiple
+        # sample sets, which is latency-bound for remote storage.
+        self._threads = threads
+
         # Eagerly load config to trigger any access problems early.
         try:
             with self.open_file(self._config_path) as f:
@@ -126,6 +141,7 @@ class AnophelesBase:
         self._cache_sample_sets: Dict[str, pd.DataFrame] = dict()
         self._cache_sample_set_to_release: Optional[Dict[str, str]] = None
         self._cache_sample_set_to_study: Optional[Dict[str, str]] = None
+        self._cache_prep_sample_sets: Dict[Any, List[str]] = dict()
         self._cache_files: Dict[str, bytes] = dict()
 
         # Set up results cache directory path.
@@ -169,6 +185,9 @@ class AnophelesBase:
         full_path = f"{self._base_path}/{path}"
         return self._fs.open(full_path)
 
+    def _init_zarr_store(self, path: str):
+        return init_zarr_store(fs=self._fs, path=path, cache_size=self._zarr_cache_size)
+
     @check_types
     def read_files(
         self,
@@ -176,8 +195,9 @@ class AnophelesBase:
         on_error: Literal["raise", "omit", "return"] = "return",
     ) -> Mapping[str, Union[bytes, Exception]]:
         # Check for any cached files.
+        paths = list(paths)
         files = {
-            path: data for path, data in self._cache_files.items() if path in paths
+            path: self._cache_files[path] for path in paths if path in self._cache_files
         }
         paths_not_cached = [p for p in paths if p not in self._cache_files]
 
@@ -317,9 +337,16 @@ class AnophelesBase:
         release_path = self._release_to_path(single_release)
         manifest_path = f"{release_path}/manifest.tsv"
 
-        # Read the manifest into a pandas dataframe.
+        # Read the manifest into a pandas dataframe. N.B., specify dtypes
+        # for known columns, avoids the cost of type inference.
+        dtype = {
+            "sample_set": "object",
+            "sample_count": "int64",
+            "study_id": "object",
+            "study_url": "object",
+        }
         with self.open_file(manifest_path) as f:
-            df = pd.read_csv(f, sep="\t", na_values="")
+            df = pd.read_csv(f, sep="\t", na_values="", dtype=dtype)
 
         # Add a "release" column for convenience.
         df["release"] = single_release
@@ -369,14 +396,31 @@ class AnophelesBase:
         # Return copy to ensure cached dataframes aren't modified by user.
         return df.copy()
 
+    def _init_sample_set_lookups(self):
+        """Build mappings from sample set to release and study, so that
+        subsequent lookups are a simple dictionary access."""
+        # N.B., build both mappings from a single pass over the sample sets
+        # dataframe, to avoid materialising the dataframe more than once.
+        df_sample_sets = self.sample_sets()
+        sample_sets = df_sample_sets["sample_set"].to_list()
+        self._cache_sample_set_to_release = dict(
+            zip(sample_sets, df_sample_sets["release"].to_list())
+        )
+        if "study_id" in df_sample_sets.columns:
+            self._cache_sample_set_to_study = dict(
+                zip(sample_sets, df_sample_sets["study_id"].to_list())
+            )
+        else:  # pragma: no cover
+            self._cache_sample_set_to_study = dict()
+
     @check_types
     @doc(
         summary="Find which release a sample set was included in.",
     )
     def lookup_release(self, sample_set: base_params.sample_set):
         if self._cache_sample_set_to_release is None:
-            df_sample_sets = self.sample_sets().set_index("sample_set")
-            self._cache_sample_set_to_release = df_sample_sets["release"].to_dict()
+            self._init_sample_set_lookups()
+        assert self._cache_sample_set_to_release is not None
 
         try:
             return self._cache_sample_set_to_release[sample_set]
@@ -389,8 +433,9 @@ class AnophelesBase:
     )
     def lookup_study(self, sample_set: base_params.sample_set):
         if self._cache_sample_set_to_study is None:
-            df_sample_sets = self.sample_sets().set_index("sample_set")
-            self._cache_sample_set_to_study = df_sample_sets["study_id"].to_dict()
+            self._init_sample_set_lookups()
+        assert self._cache_sample_set_to_study is not None
+
         try:
             return self._cache_sample_set_to_study[sample_set]
         except KeyError:
@@ -403,11 +448,27 @@ class AnophelesBase:
         allow this to be a single sample set, or a list of sample sets, or a
         release identifier, or a list of release identifiers."""
 
-        all_sample_sets = self.sample_sets()["sample_set"].to_list()
+        # This is called by most data access functions, often with the same
+        # argument, so cache the prepared list of sample sets.
+        if sample_sets is None or isinstance(sample_sets, str):
+            cache_key: Any = sample_sets
+        else:
+            cache_key = tuple(sample_sets)
+        try:
+            return list(self._cache_prep_sample_sets[cache_key])
+        except KeyError:
+            pass
+
+        # Reuse the sample set to release mapping, which covers all available
+        # sample sets, to avoid building a new list on every call.
+        if self._cache_sample_set_to_release is None:
+            self._init_sample_set_lookups()
+        all_sample_sets = self._cache_sample_set_to_release
+        assert all_sample_sets is not None
 
         if sample_sets is None:
             # All available sample sets.
-            prepped_sample_sets = all_sample_sets
+            prepped_sample_sets = list(all_sample_sets)
 
         elif isinstance(sample_sets, str):
             if sample_sets.startswith(f"{self._major_version_number}."):
@@ -439,7 +500,10 @@ class AnophelesBase:
             if s not in all_sample_sets:
                 raise ValueError(f"Sample set {s!r} not found.")
 
-        return prepped_sample_sets
+        self._cache_prep_sample_sets[cache_key] = prepped_sample_sets
+
+        # Return copy to ensure cached list isn't modified by caller.
+        return list(prepped_sample_sets)
 
     def _results_cache_add_analysis_params(self, params: dict):
         # Expect sub-classes will override to add any analysis parameters.
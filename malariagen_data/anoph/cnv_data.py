@@ -13,7 +13,6 @@ from ..util import (
     Region,
     check_types,
     da_from_zarr,
-    init_zarr_store,
     parse_multi_region,
     parse_single_region,
     simple_xarray_concat,
@@ -80,7 +79,7 @@ class AnophelesCnvData(
             release = self.lookup_release(sample_set=sample_set)
             release_path = self._release_to_path(release)
             path = f"{self._base_path}/{release_path}/cnv/{sample_set}/hmm/zarr"
-            store = init_zarr_store(fs=self._fs, path=path)
+            store = self._init_zarr_store(path=path)
             root = zarr.open_consolidated(store=store)
             self._cache_cnv_hmm[sample_set] = root
         return root
@@ -258,7 +257,7 @@ class AnophelesCnvData(
                 raise ValueError(
                     f"CNV coverage calls analysis f{analysis!r} not implemented for sample set {sample_set!r}"
                 )
-            store = init_zarr_store(fs=self._fs, path=path)
+            store = self._init_zarr_store(path=path)
             root = zarr.open_consolidated(store=store)
             self._cache_cnv_coverage_calls[key] = root
         return root
@@ -420,7 +419,7 @@ class AnophelesCnvData(
                 calls_version = "discordant_read_calls"
             path = f"{self._base_path}/{release_path}/cnv/{sample_set}/{calls_version}/zarr"
             # print(analysis)
-            store = init_zarr_store(fs=self._fs, path=path)
+            store = self._init_zarr_store(path=path)
             root = zarr.open_consolidated(store=store)
             self._cache_cnv_discordant_read_calls[sample_set] = root
         return root
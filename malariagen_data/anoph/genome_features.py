@@ -1,3 +1,4 @@
+import os
 from typing import Dict, Optional, Tuple, Mapping
 
 import bokeh.models
@@ -10,6 +11,7 @@ from pandas.io.common import infer_compression  # type: ignore
 from ..util import (
     Region,
     check_types,
+    hash_params,
     parse_multi_region,
     parse_single_region,
     read_gff3,
@@ -47,6 +49,7 @@ class AnophelesGenomeFeaturesData(AnophelesGenomeSequenceData):
         self._gene_name_overrides = gene_names
 
         # Setup caches.
+        self._cache_gff3: Optional[pd.DataFrame] = None
         self._cache_genome_features: Dict[Tuple[str, ...], pd.DataFrame] = dict()
 
     @property
@@ -57,15 +60,62 @@ class AnophelesGenomeFeaturesData(AnophelesGenomeSequenceData):
         """Deprecated, this method has been renamed to genome_features()."""
         return self.genome_features(*args, **kwargs)
 
+    def _read_gff3(self) -> pd.DataFrame:
+        # Keep the parsed GFF3 in memory, so that requests for different
+        # attributes can be unpacked without reading the GFF3 again.
+        if self._cache_gff3 is not None:
+            return self._cache_gff3
+
+        path = f"{self._base_path}/{self._geneset_gff3_path}"
+
+        # Parsing the GFF3 is slow, so if a results cache has been configured,
+        # store the parsed dataframe there and reuse it in future sessions.
+        # N.B., include file version information in the cache key, so the
+        # GFF3 is parsed again if the file at this path is ever replaced.
+        cache_path = None
+        if self._results_cache is not None:
+            name = type(self).__name__.lower() + "_gff3"
+            info = self._fs.info(path)
+            params = {
+                k: str(info[k])
+                for k in ("etag", "generation", "size", "mtime", "updated")
+                if k in info
+            }
+            params["path"] = path
+            cache_key, _ = hash_params(params)
+            cache_path = self._results_cache / name / cache_key / "gff3.pkl"
+            # N.B., the results cache is expected to be a trusted local
+            # directory, as loading a pickle can execute arbitrary code.
+            if cache_path.exists():
+                try:
+                    self._cache_gff3 = pd.read_pickle(cache_path)
+                    return self._cache_gff3
+                except Exception:
+                    # E.g., written by an incompatible pandas version, fall
+                    # back to parsing the GFF3.
+                    self._log.debug("Failed to load cached GFF3, parsing.")
+
+        compression = infer_compression(path, compression="infer")
+        with self._fs.open(path, mode="rb") as f:
+            df = read_gff3(f, compression=compression)
+
+        if cache_path is not None:
+            # Write to a temporary file then rename, so an interrupted write
+            # never leaves a partial file in the cache.
+            cache_path.parent.mkdir(exist_ok=True, parents=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+
+        self._cache_gff3 = df
+        return df
+
     def _genome_features(self, *, attributes: Tuple[str, ...]):
         try:
             df = self._cache_genome_features[attributes]
 
         except KeyError:
-            path = f"{self._base_path}/{self._geneset_gff3_path}"
-            compression = infer_compression(path, compression="infer")
-            with self._fs.open(path, mode="rb") as f:
-                df = read_gff3(f, compression=compression)
+            df = self._read_gff3()
             if attributes:
                 df = unpack_gff3_attributes(df, attributes=attributes)
             self._cache_genome_features[attributes] = df
@@ -167,12 +217,11 @@ class AnophelesGenomeFeaturesData(AnophelesGenomeSequenceData):
             attributes_normed += ("Parent",)
 
         # Obtain dataframe of all genome features.
-        df_gf = self._genome_features(attributes=attributes_normed).copy()
+        df_gf = self._genome_features(attributes=attributes_normed)
 
-        # Split the Parent column and explode.
+        # Split the Parent column, one row per parent.
         # See also https://github.com/malariagen/malariagen-data-python/issues/334
-        df_gf["Parent"] = df_gf["Parent"].str.split(",")
-        df_gf = df_gf.explode(column="Parent", ignore_index=True)
+        df_gf = _split_parents(df_gf)
 
         # Query to find children of the requested parent.
         df_children = df_gf.query(f"Parent == '{parent}'")
@@ -455,3 +504,18 @@ class AnophelesGenomeFeaturesData(AnophelesGenomeSequenceData):
             rec_parent = df_genome_features.loc[parent_id]
             # Try to access "Name" attribute, fall back to "ID" if not present.
             return rec_parent.get("Name", parent_id)
+
+
+def _split_parents(df: pd.DataFrame) -> pd.DataFrame:
+    """Split comma-separated values in the Parent column into separate rows.
+    Equivalent to splitting then exploding, but only features with multiple
+    parents need their values splitting, which is a small minority."""
+    parent = df["Parent"].to_numpy()
+    n_parents = df["Parent"].str.count(",").fillna(0).to_numpy(dtype=int) + 1
+    df_split = df.take(np.repeat(np.arange(len(df)), n_parents)).reset_index(drop=True)
+    split_parent = np.repeat(parent, n_parents)
+    starts = np.cumsum(n_parents) - n_parents
+    for i in np.nonzero(n_parents > 1)[0]:
+        split_parent[starts[i] : starts[i] + n_parents[i]] = parent[i].split(",")
+    df_split["Parent"] = split_parent
+    return df_split
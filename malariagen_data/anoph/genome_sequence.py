@@ -8,7 +8,6 @@ from ..util import (
     Region,
     check_types,
     da_from_zarr,
-    init_zarr_store,
     parse_single_region,
 )
 from . import base_params
@@ -70,7 +69,7 @@ class AnophelesGenomeSequenceData(AnophelesBase):
     def open_genome(self) -> zarr.hierarchy.Group:
         if self._cache_genome is None:
             path = f"{self._base_path}/{self._genome_zarr_path}"
-            store = init_zarr_store(fs=self._fs, path=path)
+            store = self._init_zarr_store(path=path)
             self._cache_genome = zarr.open_consolidated(store=store)
         return self._cache_genome
 
@@ -53,6 +53,9 @@ class AnophelesSampleMetadata(AnophelesBase):
 
         # Initialize cache attributes.
         self._cache_sample_metadata: Dict = dict()
+        self._cache_general_metadata: Dict[str, pd.DataFrame] = dict()
+        self._cache_cohorts_metadata: Dict[str, pd.DataFrame] = dict()
+        self._cache_aim_metadata: Dict[str, pd.DataFrame] = dict()
 
     def _general_metadata_paths(self, *, sample_sets: List[str]) -> Dict[str, str]:
         paths = dict()
@@ -89,11 +92,11 @@ class AnophelesSampleMetadata(AnophelesBase):
             release = self.lookup_release(sample_set=sample_set)
             df["release"] = release
 
-            # Derive a quarter column from month.
-            df["quarter"] = df.apply(
-                lambda row: ((row.month - 1) // 3) + 1 if row.month > 0 else -1,
-                axis="columns",
-            )
+            # Derive a quarter column from month. N.B., do this in a single
+            # vectorised pass rather than row by row, as this is called for
+            # every sample set.
+            month = df["month"].to_numpy()
+            df["quarter"] = np.where(month > 0, ((month - 1) // 3) + 1, -1)
 
             # Add study metadata columns.
             study = self.lookup_study(sample_set=sample_set)
@@ -132,18 +135,25 @@ class AnophelesSampleMetadata(AnophelesBase):
             paths=file_paths.values(), on_error="return"
         )
 
-        # Parse files into dataframes.
+        # Parse files into dataframes. N.B., cache dataframes for each sample
+        # set, to avoid parsing the same files again when sample sets are
+        # requested in different combinations.
         dfs = []
         for sample_set in sample_sets_prepped:
-            path = file_paths[sample_set]
-            data = files[path]
-            df = self._parse_general_metadata(sample_set=sample_set, data=data)
+            try:
+                df = self._cache_general_metadata[sample_set]
+            except KeyError:
+                path = file_paths[sample_set]
+                data = files[path]
+                df = self._parse_general_metadata(sample_set=sample_set, data=data)
+                self._cache_general_metadata[sample_set] = df
             dfs.append(df)
 
         # Concatenate all dataframes.
         df_ret = pd.concat(dfs, axis=0, ignore_index=True)
 
-        return df_ret
+        # Return copy to ensure cached dataframes aren't modified by user.
+        return df_ret.copy()
 
     @property
     def _cohorts_analysis(self):
@@ -280,18 +290,25 @@ class AnophelesSampleMetadata(AnophelesBase):
             paths=file_paths.values(), on_error="return"
         )
 
-        # Parse files into dataframes.
+        # Parse files into dataframes. N.B., cache dataframes for each sample
+        # set, to avoid parsing the same files again when sample sets are
+        # requested in different combinations.
         dfs = []
         for sample_set in sample_sets_prepped:
-            path = file_paths[sample_set]
-            data = files[path]
-            df = self._parse_cohorts_metadata(sample_set=sample_set, data=data)
+            try:
+                df = self._cache_cohorts_metadata[sample_set]
+            except KeyError:
+                path = file_paths[sample_set]
+                data = files[path]
+                df = self._parse_cohorts_metadata(sample_set=sample_set, data=data)
+                self._cache_cohorts_metadata[sample_set] = df
             dfs.append(df)
 
         # Concatenate all dataframes.
         df_ret = pd.concat(dfs, axis=0, ignore_index=True)
 
-        return df_ret
+        # Return copy to ensure cached dataframes aren't modified by user.
+        return df_ret.copy()
 
     @property
     def _aim_analysis(self):
@@ -375,18 +392,25 @@ class AnophelesSampleMetadata(AnophelesBase):
             paths=file_paths.values(), on_error="return"
         )
 
-        # Parse files into dataframes.
+        # Parse files into dataframes. N.B., cache dataframes for each sample
+        # set, to avoid parsing the same files again when sample sets are
+        # requested in different combinations.
         dfs = []
         for sample_set in sample_sets_prepped:
-            path = file_paths[sample_set]
-            data = files[path]
-            df = self._parse_aim_metadata(sample_set=sample_set, data=data)
+            try:
+                df = self._cache_aim_metadata[sample_set]
+            except KeyError:
+                path = file_paths[sample_set]
+                data = files[path]
+                df = self._parse_aim_metadata(sample_set=sample_set, data=data)
+                self._cache_aim_metadata[sample_set] = df
             dfs.append(df)
 
         # Concatenate all dataframes.
         df_ret = pd.concat(dfs, axis=0, ignore_index=True)
 
-        return df_ret
+        # Return copy to ensure cached dataframes aren't modified by user.
+        return df_ret.copy()
 
     @check_types
     @doc(
@@ -438,6 +462,16 @@ class AnophelesSampleMetadata(AnophelesBase):
     def clear_extra_metadata(self):
         self._extra_metadata = []
 
+    def _prefetch_metadata_files(self, *, sample_sets: List[str]):
+        paths = list(self._general_metadata_paths(sample_sets=sample_sets).values())
+        if self._aim_analysis:
+            paths += self._aim_metadata_paths(sample_sets=sample_sets).values()
+        if self._cohorts_analysis:
+            paths += self._cohorts_metadata_paths(sample_sets=sample_sets).values()
+        # N.B., files are cached, so subsequent reads will not need to
+        # access the storage again.
+        self.read_files(paths=paths, on_error="return")
+
     @check_types
     @doc(
         summary="Access sample metadata for one or more sample sets.",
@@ -465,6 +499,10 @@ class AnophelesSampleMetadata(AnophelesBase):
 
         except KeyError:
             with self._spinner(desc="Load sample metadata"):
+                # Fetch all metadata files in a single batch, so files for
+                # each type of metadata are read concurrently.
+                self._prefetch_metadata_files(sample_sets=prepped_sample_sets)
+
                 # Build a dataframe from all available metadata.
                 df_samples = self.general_metadata(sample_sets=prepped_sample_sets)
                 if self._aim_analysis:
@@ -1050,7 +1088,7 @@ class AnophelesSampleMetadata(AnophelesBase):
             if min_cohort_size is not None:
                 cohort_size = min_cohort_size
             if cohort_size is not None and n_samples < cohort_size:
-                print(
+                self._log.info(
                     f"Cohort ({cohort_label}) has insufficient samples ({n_samples}) for requested cohort size ({cohort_size}), dropping."
                 )
             else:
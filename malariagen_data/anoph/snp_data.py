@@ -1,5 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import allel  # type: ignore
 import bokeh
@@ -23,7 +24,6 @@ from ..util import (
     da_concat,
     da_from_zarr,
     dask_compress_dataset,
-    init_zarr_store,
     locate_region,
     parse_multi_region,
     parse_single_region,
@@ -64,6 +64,7 @@ class AnophelesSnpData(
         self._cache_snp_sites = None
         self._cache_snp_genotypes: Dict = dict()
         self._cache_site_filters: Dict = dict()
+        self._cache_filter_pass: Dict = dict()
         self._cache_site_annotations = None
         self._cache_locate_site_class: Dict = dict()
 
@@ -127,7 +128,7 @@ class AnophelesSnpData(
             path = (
                 f"{self._base_path}/{self._major_version_path}/snp_genotypes/all/sites/"
             )
-            store = init_zarr_store(fs=self._fs, path=path)
+            store = self._init_zarr_store(path=path)
             root = zarr.open_consolidated(store=store)
             self._cache_snp_sites = root
         return self._cache_snp_sites
@@ -148,11 +149,29 @@ class AnophelesSnpData(
             release = self.lookup_release(sample_set=sample_set)
             release_path = self._release_to_path(release)
             path = f"{self._base_path}/{release_path}/snp_genotypes/all/{sample_set}/"
-            store = init_zarr_store(fs=self._fs, path=path)
+            store = self._init_zarr_store(path=path)
             root = zarr.open_consolidated(store=store)
             self._cache_snp_genotypes[sample_set] = root
             return root
 
+    def _prefetch_snp_genotypes(self, *, sample_sets: Sequence[str]):
+        # Opening the zarr hierarchy for a sample set requires reading
+        # metadata, which is latency-bound if data are in remote storage,
+        # so open any sample sets not yet cached concurrently.
+        sample_sets_uncached = [
+            s for s in sample_sets if s not in self._cache_snp_genotypes
+        ]
+        if self._threads > 1 and len(sample_sets_uncached) > 1:
+            # Set up release lookups before opening in multiple threads.
+            self.lookup_release(sample_set=sample_sets_uncached[0])
+            with ThreadPoolExecutor(max_workers=self._threads) as executor:
+                list(
+                    executor.map(
+                        lambda s: self.open_snp_genotypes(sample_set=s),
+                        sample_sets_uncached,
+                    )
+                )
+
     def _require_site_filters_analysis(self):
         if not self._site_filters_analysis:
             raise NotImplementedError(
@@ -177,7 +196,7 @@ class AnophelesSnpData(
             return self._cache_site_filters[mask_prepped]
         except KeyError:
             path = f"{self._base_path}/{self._major_version_path}/site_filters/{self._site_filters_analysis}/{mask_prepped}/"
-            store = init_zarr_store(fs=self._fs, path=path)
+            store = self._init_zarr_store(path=path)
             root = zarr.open_consolidated(store=store)
             self._cache_site_filters[mask_prepped] = root
             return root
@@ -189,7 +208,7 @@ class AnophelesSnpData(
     def open_site_annotations(self) -> zarr.hierarchy.Group:
         if self._cache_site_annotations is None:
             path = f"{self._base_path}/{self._site_annotations_zarr_path}"
-            store = init_zarr_store(fs=self._fs, path=path)
+            store = self._init_zarr_store(path=path)
             self._cache_site_annotations = zarr.open_consolidated(store=store)
         return self._cache_site_annotations
 
@@ -251,6 +270,59 @@ class AnophelesSnpData(
             d = d[loc_region]
         return d
 
+    def _filter_pass_for_contig(
+        self,
+        *,
+        contig: str,
+        mask: base_params.site_mask,
+    ) -> np.ndarray:
+        """Load site filters for a whole contig into memory."""
+        if contig in self.virtual_contigs:
+            contigs = self.virtual_contigs[contig]
+            arrs = [self._filter_pass_for_contig(contig=c, mask=mask) for c in contigs]
+            return np.concatenate(arrs)
+
+        else:
+            assert contig in self.contigs
+
+            # Cache these data in memory to avoid repeatedly reading and
+            # decompressing the same filters data on every SNP data access.
+            cache_key = (contig, mask)
+            try:
+                return self._cache_filter_pass[cache_key]
+            except KeyError:
+                root = self.open_site_filters(mask=mask)
+                # N.B., load via dask, so that chunks are read concurrently,
+                # which matters when data are in remote storage.
+                z = root[f"{contig}/variants/filter_pass"]
+                filter_pass = da_from_zarr(
+                    z, inline_array=True, chunks="native"
+                ).compute()
+                self._cache_filter_pass[cache_key] = filter_pass
+                return filter_pass
+
+    def _filter_pass_computed(
+        self,
+        *,
+        regions: List[Region],
+        mask: base_params.site_mask,
+    ) -> np.ndarray:
+        """Load site filters into memory, concatenating over regions."""
+        arrs = []
+        for r in regions:
+            filter_pass = self._filter_pass_for_contig(contig=r.contig, mask=mask)
+            if r.start or r.end:
+                pos = self._snp_sites_for_contig(
+                    contig=r.contig,
+                    field="POS",
+                    inline_array=base_params.inline_array_default,
+                    chunks=base_params.chunks_default,
+                )
+                loc_region = locate_region(r, np.asarray(pos))
+                filter_pass = filter_pass[loc_region]
+            arrs.append(filter_pass)
+        return np.concatenate(arrs)
+
     @check_types
     @doc(
         summary="Access SNP site filters.",
@@ -393,13 +465,15 @@ class AnophelesSnpData(
 
         # Apply site mask if requested.
         if site_mask_prepped is not None:
-            loc_sites = self.site_filters(
-                region=regions,
-                mask=site_mask_prepped,
-                chunks=chunks,
-                inline_array=inline_array,
+            loc_sites = self._filter_pass_computed(
+                regions=regions, mask=site_mask_prepped
+            )
+            ret = da_compress(
+                da.from_array(loc_sites, chunks=(ret.chunks[0],)),
+                ret,
+                axis=0,
+                indexer_computed=loc_sites,
             )
-            ret = da_compress(loc_sites, ret, axis=0)
 
         return ret
 
@@ -468,6 +542,8 @@ class AnophelesSnpData(
         del site_mask
 
         with self._spinner("Access SNP genotypes"):
+            self._prefetch_snp_genotypes(sample_sets=sample_sets_prepped)
+
             # Concatenate multiple sample sets and/or contigs.
             lx = []
             for r in regions:
@@ -505,11 +581,15 @@ class AnophelesSnpData(
 
         # Apply site filters if requested.
         if site_mask_prepped is not None:
-            loc_sites = self.site_filters(
-                region=regions,
-                mask=site_mask_prepped,
+            loc_sites = self._filter_pass_computed(
+                regions=regions, mask=site_mask_prepped
+            )
+            d = da_compress(
+                da.from_array(loc_sites, chunks=(d.chunks[0],)),
+                d,
+                axis=0,
+                indexer_computed=loc_sites,
             )
-            d = da_compress(loc_sites, d, axis=0)
 
         # Apply sample selection if requested.
         if sample_query is not None:
@@ -1011,6 +1091,8 @@ class AnophelesSnpData(
     ):
         # Access SNP calls and concatenate multiple sample sets and/or regions.
         with self._spinner("Access SNP calls"):
+            self._prefetch_snp_genotypes(sample_sets=sample_sets)
+
             lx = []
             for r in regions:
                 ly = []
@@ -1520,27 +1602,62 @@ class AnophelesSnpData(
         # Determine contig sequence length.
         seq_length = self.genome_sequence(resolved_region).shape[0]
 
+        name = "is_accessible"
+        params = dict(
+            region=resolved_region.to_dict(),
+            site_mask=site_mask_prepped,
+        )
+
+        # Try to retrieve results from the cache. N.B., store as packed bits,
+        # to reduce the size of the cached data 8-fold.
+        try:
+            results = self.results_cache_get(name=name, params=params)
+
+        except CacheMiss:
+            is_accessible = self._is_accessible(
+                region=resolved_region,
+                site_mask=site_mask_prepped,
+                seq_length=seq_length,
+                inline_array=inline_array,
+                chunks=chunks,
+            )
+            results = dict(is_accessible_packed=np.packbits(is_accessible))
+            self.results_cache_set(name=name, params=params, results=results)
+            return is_accessible
+
+        # Unpack results.
+        packed = results["is_accessible_packed"]
+        return np.unpackbits(packed, count=seq_length).view(bool)
+
+    def _is_accessible(
+        self,
+        *,
+        region: Region,
+        site_mask: base_params.site_mask,
+        seq_length: int,
+        inline_array: base_params.inline_array,
+        chunks: base_params.chunks,
+    ) -> np.ndarray:
         # Set up output.
         is_accessible = np.zeros(seq_length, dtype=bool)
 
         # Access SNP site positions.
-        pos = self.snp_sites(region=resolved_region, field="POS").compute()
-        if resolved_region.start:
-            offset = resolved_region.start
+        pos = self.snp_sites(
+            region=region,
+            field="POS",
+            inline_array=inline_array,
+            chunks=chunks,
+        ).compute()
+        if region.start:
+            offset = region.start
         else:
             offset = 1
 
         # Access site filters.
-        filter_pass = self._site_filters_for_region(
-            region=resolved_region,
-            mask=site_mask_prepped,
-            field="filter_pass",
-            inline_array=inline_array,
-            chunks=chunks,
-        ).compute()
+        filter_pass = self._filter_pass_computed(regions=[region], mask=site_mask)
 
-        # Assign values from site filters.
-        is_accessible[pos - offset] = filter_pass
+        # Mark sites which pass filters as accessible.
+        np.put(is_accessible, pos[filter_pass] - offset, True)
 
         return is_accessible
 
@@ -150,6 +150,8 @@ class AnophelesDataResource(
         taxon_colors: Optional[Mapping[str, str]],
         virtual_contigs: Optional[Mapping[str, Sequence[str]]],
         gene_names: Optional[Mapping[str, str]],
+        zarr_cache_size: Optional[int],
+        threads: int,
     ):
         super().__init__(
             url=url,
@@ -182,6 +184,8 @@ class AnophelesDataResource(
             taxon_colors=taxon_colors,
             virtual_contigs=virtual_contigs,
             gene_names=gene_names,
+            zarr_cache_size=zarr_cache_size,
+            threads=threads,
         )
 
     @property
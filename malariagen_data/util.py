@@ -43,20 +43,31 @@ def gff3_parse_attributes(attributes_string):
     """Parse a string of GFF3 attributes ('key=value' pairs delimited by ';')
     and return a dictionary."""
 
+    # most attribute strings contain no escaped characters, in which case
+    # decoding can be skipped
+    if "%" in attributes_string or "+" in attributes_string:
+        decode = unquote_plus
+    else:
+        decode = _identity
+
     attributes = dict()
     fields = attributes_string.split(";")
     for f in fields:
         if "=" in f:
             key, value = f.split("=")
-            key = unquote_plus(key).strip()
-            value = unquote_plus(value.strip())
+            key = decode(key).strip()
+            value = decode(value.strip())
             attributes[key] = value
         elif len(f) > 0:
             # not strictly kosher, treat as a flag
-            attributes[unquote_plus(f).strip()] = True
+            attributes[decode(f).strip()] = True
     return attributes
 
 
+def _identity(x):
+    return x
+
+
 gff3_cols = (
     "contig",
     "source",
@@ -69,6 +80,18 @@ gff3_cols = (
     "attributes",
 )
 
+gff3_dtype = {
+    "contig": object,
+    "source": object,
+    "type": object,
+    "start": "int64",
+    "end": "int64",
+    "score": "float64",
+    "strand": object,
+    "phase": "float64",
+    "attributes": object,
+}
+
 
 def read_gff3(buf, compression="gzip"):
     # read as dataframe
@@ -79,6 +102,7 @@ def read_gff3(buf, compression="gzip"):
         names=gff3_cols,
         na_values=["", "."],
         compression=compression,
+        dtype=gff3_dtype,
     )
 
     # parse attributes
@@ -354,10 +378,19 @@ def init_filesystem(url, **kwargs):
     return fs, path
 
 
-def init_zarr_store(fs, path):
-    """Initialise a zarr store (mapping) from a fsspec filesystem."""
+def init_zarr_store(fs, path, cache_size=None):
+    """Initialise a zarr store (mapping) from a fsspec filesystem.
+
+    If `cache_size` is given, wrap the store in an in-memory LRU cache of up
+    to that many bytes, so that repeated reads of the same chunks do not need
+    to fetch the data again from storage.
+
+    """
 
-    return SafeStore(FSMap(fs=fs, root=path, check=False, create=False))
+    store = SafeStore(FSMap(fs=fs, root=path, check=False, create=False))
+    if cache_size:
+        store = zarr.LRUStoreCache(store, max_size=cache_size)
+    return store
 
 
 # N.B., previously Region was defined as a named tuple. However, this led to
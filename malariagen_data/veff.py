@@ -69,10 +69,11 @@ class Annotator(object):
         try:
             seq = self._genome_cache[chrom]
         except KeyError:
-            seq = self._genome[chrom][:]
+            # decode the whole contig once, rather than decoding a small
+            # slice of bytes every time a reference sequence is requested
+            seq = self._genome[chrom][:].tobytes().decode()
             self._genome_cache[chrom] = seq
         ref_seq = seq[start - 1 : stop]
-        ref_seq = ref_seq.tobytes().decode()
         return ref_seq
 
     def get_ref_allele_coords(self, chrom, pos, ref):
@@ -118,19 +119,20 @@ class Annotator(object):
         feature_stop = feature.end
         feature_strand = feature.strand
 
-        variant_iterator = variants.itertuples(index=True)
+        # iterate over plain lists of values, avoids the overhead of
+        # creating a namedtuple for every row
+        variant_iterator = zip(
+            variants["position"].to_list(),
+            variants["ref_allele"].to_list(),
+            variants["alt_allele"].to_list(),
+        )
         if progress:
             variant_iterator = progress(
                 variant_iterator, desc="Compute SNP effects", total=len(variants)
             )
 
-        for row in variant_iterator:
-            # some parameters
-            chrom = feature_contig
-            pos = row.position
-            ref = row.ref_allele
-            alt = row.alt_allele
-
+        chrom = feature_contig
+        for pos, ref, alt in variant_iterator:
             # obtain start and stop coordinates of the reference allele
             ref_start, ref_stop = self.get_ref_allele_coords(chrom, pos, ref)
 
@@ -178,6 +178,14 @@ def test_prep_sample_sets_param(ag3_sim_api: AnophelesBase):
     with pytest.raises(ValueError):
         ag3_sim_api._prep_sample_sets_param(sample_sets=["AG1000G-AO", "foobar"])
 
+    # Check cached results are not affected by modifying returned values.
+    prepped = ag3_sim_api._prep_sample_sets_param(sample_sets="3.0")
+    prepped.append("foobar")
+    assert ag3_sim_api._prep_sample_sets_param(sample_sets="3.0") == [
+        "AG1000G-AO",
+        "AG1000G-BF-A",
+    ]
+
 
 @parametrize_with_cases("fixture,api", cases=".")
 def test_lookup_study(fixture, api):
@@ -191,3 +191,49 @@ def test_genome_features_virtual_contigs(ag3_sim_api, chrom):
     assert isinstance(df, pd.DataFrame)
     if len(df) > 0:
         assert df["contig"].unique() == region.split(":")[0]
+
+
+def test_genome_features_results_cache(ag3_sim_fixture, tmp_path, monkeypatch):
+    kwargs = dict(
+        url=ag3_sim_fixture.url,
+        config_path=_ag3.CONFIG_PATH,
+        gcs_url=_ag3.GCS_URL,
+        major_version_number=_ag3.MAJOR_VERSION_NUMBER,
+        major_version_path=_ag3.MAJOR_VERSION_PATH,
+        pre=True,
+        gff_gene_type="gene",
+        gff_gene_name_attribute="Name",
+        gff_default_attributes=("ID", "Parent", "Name", "description"),
+        results_cache=tmp_path.as_posix(),
+    )
+
+    # First access parses the GFF3 and saves to the results cache.
+    api = AnophelesGenomeFeaturesData(**kwargs)
+    df1 = api.genome_features(attributes=None)
+    assert len(list(tmp_path.glob("*/*/gff3.pkl"))) == 1
+
+    # A new instance should load the parsed GFF3 from the results cache.
+    api = AnophelesGenomeFeaturesData(**kwargs)
+    df2 = api.genome_features(attributes=None)
+    assert_frame_equal(df1, df2)
+
+    # An unreadable cache file should be ignored and replaced.
+    (cache_path,) = tmp_path.glob("*/*/gff3.pkl")
+    cache_path.write_bytes(b"foo")
+    api = AnophelesGenomeFeaturesData(**kwargs)
+    df3 = api.genome_features(attributes=None)
+    assert_frame_equal(df1, df3)
+    assert_frame_equal(pd.read_pickle(cache_path), df1)
+
+    # Modifying the GFF3 should invalidate the cache.
+    api = AnophelesGenomeFeaturesData(**kwargs)
+    fs_info = api._fs.info
+
+    def fs_info_modified(path, **kwargs):
+        info = dict(fs_info(path, **kwargs))
+        info["mtime"] += 1
+        return info
+
+    monkeypatch.setattr(api._fs, "info", fs_info_modified)
+    api.genome_features(attributes=None)
+    assert len(list(tmp_path.glob("*/*/gff3.pkl"))) == 2
@@ -126,6 +126,26 @@ def test_general_metadata_with_single_sample_set(fixture, api: AnophelesSampleMe
     expected_len = sample_count.loc[sample_set]
     assert len(df) == expected_len
 
+    # Check quarter is derived from month.
+    expected_quarter = [((m - 1) // 3) + 1 if m > 0 else -1 for m in df["month"]]
+    assert df["quarter"].to_list() == expected_quarter
+
+
+@parametrize_with_cases("fixture,api", cases=".")
+def test_general_metadata_is_not_modified_by_user(
+    fixture, api: AnophelesSampleMetadata
+):
+    sample_set = random.choice(api.sample_sets()["sample_set"].to_list())
+    df = api.general_metadata(sample_sets=sample_set)
+    expected_sample_ids = df["sample_id"].to_list()
+
+    # Modify the returned dataframe.
+    df.loc[0, "sample_id"] = "foo"
+
+    # Check a subsequent call is unaffected.
+    df = api.general_metadata(sample_sets=sample_set)
+    assert df["sample_id"].to_list() == expected_sample_ids
+
 
 @parametrize_with_cases("fixture,api", cases=".")
 def test_general_metadata_with_multiple_sample_sets(
@@ -1,5 +1,7 @@
 import random
+import threading
 from itertools import product
+from typing import Dict
 
 import allel  # type: ignore
 import bokeh.model
@@ -15,6 +17,7 @@ from malariagen_data import af1 as _af1
 from malariagen_data import ag3 as _ag3
 from malariagen_data.anoph.base_params import DEFAULT
 from malariagen_data.anoph.snp_data import AnophelesSnpData
+from malariagen_data.util import Region, parse_single_region
 
 
 @pytest.fixture
@@ -94,6 +97,36 @@ def test_open_snp_sites(fixture, api: AnophelesSnpData):
         assert "ALT" in variants
 
 
+def test_open_snp_sites_with_zarr_cache(ag3_sim_fixture, tmp_path):
+    # N.B., zarr caching is ignored for the local file system, so use a
+    # chained URL to exercise the cache.
+    api = AnophelesSnpData(
+        url=f"simplecache::{ag3_sim_fixture.url}",
+        storage_options=dict(simplecache=dict(cache_storage=tmp_path.as_posix())),
+        config_path=_ag3.CONFIG_PATH,
+        gcs_url=_ag3.GCS_URL,
+        major_version_number=_ag3.MAJOR_VERSION_NUMBER,
+        major_version_path=_ag3.MAJOR_VERSION_PATH,
+        pre=True,
+        gff_gene_type="gene",
+        gff_gene_name_attribute="Name",
+        gff_default_attributes=("ID", "Parent", "Name", "description"),
+        default_site_mask="gamb_colu_arab",
+        zarr_cache_size=2**20,
+    )
+    root = api.open_snp_sites()
+    assert isinstance(root.chunk_store, zarr.LRUStoreCache)
+
+    # Check data are the same as when read without caching.
+    contig = ag3_sim_fixture.random_contig()
+    expected_pos = zarr.open(
+        f"{ag3_sim_fixture.bucket_path}/v3/snp_genotypes/all/sites/{contig}/variants/POS"
+    )
+    for _ in range(2):
+        pos = api.snp_sites(region=contig, field="POS").compute()
+        assert_array_equal(pos, expected_pos[:])
+
+
 def test_site_mask_ids_ag3(ag3_sim_api: AnophelesSnpData):
     assert ag3_sim_api.site_mask_ids == ("gamb_colu_arab", "gamb_colu", "arab")
 
@@ -182,6 +215,55 @@ def test_site_filters(fixture, api: AnophelesSnpData):
         check_site_filters(api, mask=mask, region=region)
 
 
+def test_filter_pass_cached_per_contig(ag3_sim_fixture, ag3_sim_api: AnophelesSnpData):
+    api = ag3_sim_api
+    contig = ag3_sim_fixture.random_contig()
+    mask = random.choice(api.site_mask_ids)
+    pos = api.snp_sites(region=contig, field="POS").compute()
+    expected_filter_pass = api.site_filters(region=contig, mask=mask).compute()
+    api._cache_filter_pass.clear()
+
+    # Different regions within a contig should share one cached array.
+    for _ in range(3):
+        start, end = sorted(random.sample(range(1, int(pos[-1])), 2))
+        filter_pass = api._filter_pass_computed(
+            regions=[Region(contig, start, end)], mask=mask
+        )
+        loc_region = (pos >= start) & (pos <= end)
+        assert_array_equal(filter_pass, expected_filter_pass[loc_region])
+    assert list(api._cache_filter_pass) == [(contig, mask)]
+
+
+def test_filter_pass_multiple_chunks(
+    ag3_sim_fixture, ag3_sim_api: AnophelesSnpData, tmp_path, monkeypatch
+):
+    api = ag3_sim_api
+    contig = ag3_sim_fixture.random_contig()
+    mask = random.choice(api.site_mask_ids)
+    pos = api.snp_sites(region=contig, field="POS").compute()
+    expected_filter_pass = api.site_filters(region=contig, mask=mask).compute()
+
+    # Rechunk site filters, as simulated data have a single chunk per contig.
+    root = zarr.open_group(tmp_path.as_posix(), mode="w")
+    root.create_dataset(
+        f"{contig}/variants/filter_pass",
+        data=expected_filter_pass,
+        chunks=(len(expected_filter_pass) // 7,),
+    )
+    assert root[f"{contig}/variants/filter_pass"].nchunks > 1
+    monkeypatch.setattr(api, "open_site_filters", lambda mask: root)
+    api._cache_filter_pass.clear()
+
+    filter_pass = api._filter_pass_computed(regions=[Region(contig)], mask=mask)
+    assert_array_equal(filter_pass, expected_filter_pass)
+    start, end = sorted(random.sample(range(1, int(pos[-1])), 2))
+    filter_pass = api._filter_pass_computed(
+        regions=[Region(contig, start, end)], mask=mask
+    )
+    loc_region = (pos >= start) & (pos <= end)
+    assert_array_equal(filter_pass, expected_filter_pass[loc_region])
+
+
 def check_snp_sites(api: AnophelesSnpData, region):
     pos = api.snp_sites(region=region, field="POS")
     ref = api.snp_sites(region=region, field="REF")
@@ -450,6 +532,51 @@ def test_snp_genotypes_with_sample_sets_param(fixture, api: AnophelesSnpData):
         check_snp_genotypes(api=api, sample_sets=sample_sets, region=region)
 
 
+@pytest.mark.parametrize("threads", [1, 4])
+def test_snp_genotypes_with_threads(
+    ag3_sim_fixture, ag3_sim_api: AnophelesSnpData, threads
+):
+    api = AnophelesSnpData(
+        url=ag3_sim_fixture.url,
+        config_path=_ag3.CONFIG_PATH,
+        gcs_url=_ag3.GCS_URL,
+        major_version_number=_ag3.MAJOR_VERSION_NUMBER,
+        major_version_path=_ag3.MAJOR_VERSION_PATH,
+        pre=True,
+        gff_gene_type="gene",
+        gff_gene_name_attribute="Name",
+        gff_default_attributes=("ID", "Parent", "Name", "description"),
+        default_site_mask="gamb_colu_arab",
+        threads=threads,
+    )
+
+    # Record which thread first opens SNP genotypes for each sample set.
+    opened: Dict[str, int] = dict()
+    open_snp_genotypes = api.open_snp_genotypes
+
+    def open_snp_genotypes_spy(sample_set):
+        opened.setdefault(sample_set, threading.get_ident())
+        return open_snp_genotypes(sample_set=sample_set)
+
+    api.open_snp_genotypes = open_snp_genotypes_spy  # type: ignore
+
+    region = ag3_sim_fixture.random_region_str()
+    gt = api.snp_genotypes(region=region)
+    expected_gt = ag3_sim_api.snp_genotypes(region=region)
+    assert_array_equal(gt.compute(), expected_gt.compute())
+
+    # All sample sets should be opened, in worker threads if enabled.
+    sample_sets = api.sample_sets()["sample_set"].to_list()
+    assert len(sample_sets) > 1
+    assert sorted(opened) == sorted(sample_sets)
+    assert set(api._cache_snp_genotypes) == set(sample_sets)
+    main_thread = threading.get_ident()
+    if threads > 1:
+        assert main_thread not in opened.values()
+    else:
+        assert set(opened.values()) == {main_thread}
+
+
 @parametrize_with_cases("fixture,api", cases=".")
 def test_snp_genotypes_with_region_param(fixture, api: AnophelesSnpData):
     # Fixed parameters.
@@ -968,6 +1095,19 @@ def _check_is_accessible(api: AnophelesSnpData, region, mask):
     assert is_accessible.ndim == 1
     assert is_accessible.shape[0] == api.genome_sequence(region=region).shape[0]
 
+    # Check values match site filters at SNP positions.
+    pos = api.snp_sites(region=region, field="POS").compute()
+    filter_pass = api.site_filters(region=region, mask=mask).compute()
+    resolved_region = parse_single_region(api, region)
+    offset = resolved_region.start or 1
+    assert is_accessible.sum() == filter_pass.sum()
+    assert_array_equal(is_accessible[pos - offset], filter_pass)
+
+    # Check results are the same when loaded from the results cache.
+    is_accessible_cached = api.is_accessible(region=region, site_mask=mask)
+    assert is_accessible_cached.dtype == bool
+    assert_array_equal(is_accessible_cached, is_accessible)
+
 
 @parametrize_with_cases("fixture,api", cases=".")
 def test_is_accessible(fixture, api: AnophelesSnpData):